@@ -0,0 +1,94 @@
+"""Compare latency and wire size of resource pages per Content-Encoding.
+
+Usage (from apps/ai-service):
+    python -m benchmarks.bench_compression [--rounds 50]
+"""
+import argparse
+import asyncio
+import random
+import string
+import time
+from datetime import datetime
+from fastapi import FastAPI
+import httpx
+from src.middleware.compression import CompressionMiddleware, available_encodings
+
+# (label, resources per page, content bytes per resource)
+PAGES = [
+    ("100 x 1KB", 100, 1_024),
+    ("100 x 10KB", 100, 10_240),
+    ("100 x 50KB", 100, 51_200),
+]
+
+
+def make_content(size: int) -> str:
+    # Word-like text compresses like real resource content, unlike random bytes or one repeated char
+    words = ["".join(random.choices(string.ascii_lowercase, k=random.randint(2, 9))) for _ in range(500)]
+    out = []
+    length = 0
+    while length < size:
+        word = random.choice(words)
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out)[:size]
+
+
+def make_page(count: int, size: int) -> list:
+    return [
+        {
+            "_id": f"{i:024x}",
+            "name": f"Resource {i}",
+            "type": random.choice(["text", "prompt", "document"]),
+            "content": make_content(size),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def build_app(pages: dict) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/resources/{label}")
+    async def list_resources(label: str):
+        return pages[label]
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, label: str, encoding: str, rounds: int):
+    wire_bytes = 0
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        async with client.stream("GET", f"/resources/{label}", headers={"Accept-Encoding": encoding}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        timings.append(time.perf_counter() - start)
+        wire_bytes = len(raw)
+    timings.sort()
+    return wire_bytes, timings[len(timings) // 2], timings[int(len(timings) * 0.95) - 1]
+
+
+async def main(rounds: int):
+    random.seed(42)
+    pages = {label: make_page(count, size) for label, count, size in PAGES}
+    transport = httpx.ASGITransport(app=build_app(pages))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'page':<12} {'encoding':<9} {'bytes':>12} {'ratio':>7} {'p50 ms':>9} {'p95 ms':>9}")
+        for label, _, _ in PAGES:
+            baseline = None
+            for encoding in ("identity",) + available_encodings():
+                wire_bytes, p50, p95 = await measure(client, label, encoding, rounds)
+                baseline = baseline or wire_bytes
+                print(
+                    f"{label:<12} {encoding:<9} {wire_bytes:>12,} {baseline / wire_bytes:>6.1f}x"
+                    f" {p50 * 1000:>9.2f} {p95 * 1000:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    asyncio.run(main(parser.parse_args().rounds))
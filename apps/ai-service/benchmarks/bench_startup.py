@@ -0,0 +1,98 @@
+"""Import-time profile and time-to-first-request of the ai-service.
+
+Usage (from apps/ai-service):
+    python -m benchmarks.bench_startup [--runs 5] [--top 15]
+
+MONGODB_URL defaults to mongodb://localhost:27017; no server is needed for /health.
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+import httpx
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+    # Measure a warm bytecode cache, like the pre-compiled image
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_profile(top: int):
+    """Summarise `python -X importtime -c 'import src.main'` by top-level package."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    per_package = defaultdict(int)
+    total = 0
+    for line in result.stderr.splitlines():
+        if (match := IMPORTTIME_LINE.match(line)) is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        per_package[module.split(".")[0]] += int(self_us)
+        if module == "src.main":
+            total = int(cumulative_us)
+
+    print(f"import src.main: {total / 1000:.1f} ms cumulative")
+    print(f"{'package':<24} {'self ms':>9} {'share':>7}")
+    for package, self_us in sorted(per_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{package:<24} {self_us / 1000:>9.1f} {self_us / max(total, 1):>6.0%}")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(timeout: float = 60.0) -> float:
+    """Seconds from spawning uvicorn until GET /health answers 200."""
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--log-level", "warning"],
+        env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            time.sleep(0.005)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    import_profile(args.top)
+
+    samples = [time_to_first_request() for _ in range(args.runs)]
+    print()
+    print(
+        f"time to first request over {args.runs} runs: "
+        f"median {statistics.median(samples) * 1000:.0f} ms, "
+        f"min {min(samples) * 1000:.0f} ms, max {max(samples) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,30 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 class Settings(BaseSettings):
     APP_NAME: str = "OpenPanel AI Service"
     MONGODB_URL: str
     DB_NAME: str = "openpanel_ai"
     LOG_LEVEL: str = "INFO"
+    # Content deduplication mode
+    DEDUP_MODE: Literal["off", "reject", "return_existing", "reference"] = "off"
+    # Seconds between /resources/stats reconciliations (0 disables the background task)
+    STATS_RECONCILE_INTERVAL: int = 3600
+    # Comma-separated disposable types expired by a TTL index on created_at
+    TTL_TYPES: str = ""
+    TTL_SECONDS: int = 0
+    # Move other resources older than this into resources_archive (0 disables archival)
+    ARCHIVE_AFTER_DAYS: int = 0
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_INTERVAL: int = 3600
+    # Responses smaller than this many bytes are sent uncompressed
+    COMPRESSION_MINIMUM_SIZE: int = 1024
 
     class Config:
         env_file = ".env"
 
+# Resolved on first use, never at import time, so importing the app needs no environment
 @lru_cache()
 def get_settings():
     return Settings()
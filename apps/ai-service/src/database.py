@@ -1,15 +1,19 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from typing import TYPE_CHECKING
 from loguru import logger
 from .config import get_settings
 
-settings = get_settings()
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 class Database:
-    client: AsyncIOMotorClient = None
+    client: "AsyncIOMotorClient" = None
 
     def connect(self):
+        # Imported here so the driver is only loaded once a connection is needed
+        from motor.motor_asyncio import AsyncIOMotorClient
+
         try:
-            self.client = AsyncIOMotorClient(settings.MONGODB_URL)
+            self.client = AsyncIOMotorClient(get_settings().MONGODB_URL)
             logger.info("Connected to MongoDB")
         except Exception as e:
             logger.error(f"Could not connect to MongoDB: {e}")
@@ -18,10 +22,13 @@ class Database:
     def close(self):
         if self.client:
             self.client.close()
+            self.client = None
             logger.info("Closed MongoDB connection")
 
-    def get_db(self):
-        return self.client[settings.DB_NAME]
+    def get_db(self) -> "AsyncIOMotorDatabase":
+        if self.client is None:
+            self.connect()
+        return self.client[get_settings().DB_NAME]
 
 db = Database()
 
@@ -1,26 +1,72 @@
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from loguru import logger
 from .database import db
+from .middleware.compression import CompressionMiddleware
+from .services import archive
+from .services.content_store import ensure_indexes
+from .services.stats import run_reconciler
 from .routers import resources
-from .config import get_settings
+from .config import Settings, get_settings
 
-settings = get_settings()
+# Backoff between index setup attempts while MongoDB is unreachable, in seconds
+INDEX_RETRY_DELAY = 1
+INDEX_RETRY_MAX_DELAY = 60
+
+async def ensure_database_indexes(database, settings: Settings, ttl_types):
+    delay = INDEX_RETRY_DELAY
+    while True:
+        try:
+            await ensure_indexes(database, settings.DEDUP_MODE)
+            await archive.ensure_collection(database)
+            await archive.ensure_indexes(database, ttl_types, settings.TTL_SECONDS)
+            return
+        except Exception as e:
+            logger.error(f"Could not prepare MongoDB indexes, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, INDEX_RETRY_MAX_DELAY)
+
+async def prepare_database(settings: Settings):
+    """Connection, index setup and maintenance loops; runs in the background so startup never waits on MongoDB."""
+    # Creating the client is also where the driver gets imported
+    database = db.get_db()
+    ttl_types = archive.parse_types(settings.TTL_TYPES)
+    # The archiver relies on the compressed archive collection, so the loops wait for it
+    await ensure_database_indexes(database, settings, ttl_types)
+
+    loops = []
+    if settings.STATS_RECONCILE_INTERVAL > 0:
+        loops.append(run_reconciler(database, settings.STATS_RECONCILE_INTERVAL))
+    if settings.ARCHIVE_AFTER_DAYS > 0:
+        loops.append(archive.run_archiver(
+            database,
+            settings.ARCHIVE_AFTER_DAYS,
+            ttl_types,
+            settings.ARCHIVE_BATCH_SIZE,
+            settings.ARCHIVE_INTERVAL,
+        ))
+    await asyncio.gather(*loops)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up AI Service...")
-    db.connect()
+    settings = get_settings()
+    app.title = settings.APP_NAME
+    background = asyncio.create_task(prepare_database(settings))
     yield
     logger.info("Shutting down AI Service...")
+    background.cancel()
     db.close()
 
 app = FastAPI(
-    title=settings.APP_NAME,
     lifespan=lifespan,
     description="Microservice for AI Logic and Resource Management using MongoDB"
 )
 
+# Options are resolved from the settings when the middleware stack is built on the first request
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(resources.router, tags=["resources"], prefix="/resources")
 
 @app.get("/health", tags=["health"])
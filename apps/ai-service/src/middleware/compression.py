@@ -0,0 +1,184 @@
+import zlib
+from typing import Dict, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ..config import get_settings
+
+# Optional codecs, imported when the first middleware instance is built rather than at import time
+zstandard = None
+brotli = None
+
+# Preferred first when the client weighs encodings equally
+PREFERENCE = ("zstd", "br", "gzip")
+
+# Levels for on-the-fly compression of dynamic JSON: most of the ratio, little of the CPU
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 5}
+
+EXCLUDED_CONTENT_TYPES = ("text/event-stream", "image/", "video/", "audio/", "application/zip")
+
+
+def _load_codecs():
+    global zstandard, brotli
+    if zstandard is None:
+        try:
+            import zstandard
+        except ImportError:  # pragma: no cover - optional dependency
+            pass
+    if brotli is None:
+        try:
+            import brotli
+        except ImportError:  # pragma: no cover - optional dependency
+            pass
+
+
+def available_encodings() -> Tuple[str, ...]:
+    _load_codecs()
+    return tuple(
+        e for e in PREFERENCE
+        if (e == "zstd" and zstandard is not None) or (e == "br" and brotli is not None) or e == "gzip"
+    )
+
+
+def negotiate(accept_encoding: str, supported: Tuple[str, ...]) -> Optional[str]:
+    """Pick the encoding with the highest q-value, breaking ties by server preference."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Compressor:
+    """Incremental compressor; `flush` emits everything buffered so far without ending the stream."""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=level)
+        else:
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._obj.process(data)
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "zstd":
+            return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._obj.flush()
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+class CompressionMiddleware:
+    """Compress responses with zstd, brotli or gzip according to Accept-Encoding.
+
+    Single-body responses below `minimum_size` are sent as-is. Streaming responses are
+    compressed chunk by chunk and flushed after each one, so nothing is buffered.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None, levels: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else get_settings().COMPRESSION_MINIMUM_SIZE
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.supported = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.supported)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.levels[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, level: int, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk tells us whether compression pays off
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = "content-encoding" in headers or content_type.startswith(EXCLUDED_CONTENT_TYPES)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                if not self.passthrough:
+                    MutableHeaders(raw=start["headers"]).add_vary_header("Accept-Encoding")
+                await self._send(start)
+                await self._send(message)
+                self.passthrough = True
+                return
+
+            self.compressor = _Compressor(self.encoding, self.level)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            del headers["Content-Length"]
+            await self._send(start)
+
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
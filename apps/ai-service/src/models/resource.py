@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from bson import ObjectId
 
@@ -26,6 +26,7 @@ class ResourceModel(BaseModel):
     name: str = Field(...)
     type: str = Field(...)
     content: str = Field(...)
+    content_hash: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     model_config = ConfigDict(
@@ -50,3 +51,10 @@ class UpdateResourceModel(BaseModel):
         arbitrary_types_allowed=True,
         json_encoders={ObjectId: str}
     )
+
+class ResourceStatsModel(BaseModel):
+    total: int
+    content_bytes: int
+    by_type: Dict[str, int]
+    created_per_day: Dict[str, int]
+    reconciled_at: Optional[datetime] = None
@@ -1,61 +1,193 @@
-from fastapi import APIRouter, Body, HTTPException, status, Depends
+from fastapi import APIRouter, Body, HTTPException, Query, status, Depends
 from fastapi.encoders import jsonable_encoder
-from typing import List
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from typing import TYPE_CHECKING, List
+from ..config import Settings, get_settings
 from ..database import get_database
-from ..models.resource import ResourceModel, UpdateResourceModel
+from ..models.resource import ResourceModel, ResourceStatsModel, UpdateResourceModel
+from ..services import archive, stats
+from ..services.content_store import acquire_blob, compute_content_hash, release_blob, resolve_contents
 from bson import ObjectId
 
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
 router = APIRouter()
 
+async def _find_duplicate(db: "AsyncIOMotorDatabase", content_hash: str, mode: str):
+    if (existing := await db["resources"].find_one({"content_hash": content_hash})) is None:
+        # The unique index only covers hot resources
+        if (existing := await archive.find_archived_by_hash(db, content_hash)) is None:
+            return None
+    if mode == "reject":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Resource with identical content already exists: {existing['_id']}",
+        )
+    existing["_id"] = str(existing["_id"])
+    return existing
+
 @router.post("/", response_description="Add new resource", response_model=ResourceModel)
-async def create_resource(resource: ResourceModel = Body(...), db: AsyncIOMotorDatabase = Depends(get_database)):
-    resource_dict = resource.model_dump(by_alias=True, exclude=["id"])
-    new_resource = await db["resources"].insert_one(resource_dict)
+async def create_resource(
+    resource: ResourceModel = Body(...),
+    db: "AsyncIOMotorDatabase" = Depends(get_database),
+    settings: Settings = Depends(get_settings),
+):
+    from pymongo.errors import DuplicateKeyError
+
+    resource_dict = resource.model_dump(by_alias=True, exclude=["id", "content_hash"])
+    resource_dict["content_size"] = stats.content_size(resource_dict["content"])
+    mode = settings.DEDUP_MODE
+
+    if mode != "off":
+        content_hash = compute_content_hash(resource_dict["content"])
+        resource_dict["content_hash"] = content_hash
+
+        if mode in ("reject", "return_existing"):
+            if (existing := await _find_duplicate(db, content_hash, mode)) is not None:
+                return existing
+        elif mode == "reference":
+            await acquire_blob(db, content_hash, resource_dict.pop("content"))
+            resource_dict["content_ref"] = content_hash
+
+    try:
+        new_resource = await db["resources"].insert_one(resource_dict)
+    except Exception as e:
+        if "content_ref" in resource_dict:
+            # Nothing points at the blob reference taken above
+            await release_blob(db, resource_dict["content_ref"])
+        if isinstance(e, DuplicateKeyError) and mode in ("reject", "return_existing"):
+            # Lost a race against a concurrent insert of the same content
+            if (existing := await _find_duplicate(db, resource_dict["content_hash"], mode)) is not None:
+                return existing
+        raise
+
+    await stats.record_insert(db, resource_dict["type"], resource_dict["content_size"], resource_dict["created_at"])
+
     created_resource = await db["resources"].find_one({"_id": new_resource.inserted_id})
     # Convert _id to string for response
     if created_resource:
         created_resource["_id"] = str(created_resource["_id"])
+        await resolve_contents(db, [created_resource])
     return created_resource
 
 @router.get("/", response_description="List all resources", response_model=List[ResourceModel])
-async def list_resources(limit: int = 100, db: AsyncIOMotorDatabase = Depends(get_database)):
+async def list_resources(limit: int = 100, db: "AsyncIOMotorDatabase" = Depends(get_database)):
     resources = await db["resources"].find().to_list(limit)
     # Convert _id to string
     for r in resources:
         r["_id"] = str(r["_id"])
-    return resources
+    return await resolve_contents(db, resources)
+
+@router.get("/stats", response_description="Pre-aggregated resource statistics", response_model=ResourceStatsModel)
+async def resource_stats(days: int = Query(30, ge=1, le=366), db: "AsyncIOMotorDatabase" = Depends(get_database)):
+    return await stats.get_stats(db, days)
+
+@router.get("/by-hash/{content_hash}", response_description="Find resources by content hash", response_model=List[ResourceModel])
+async def find_resources_by_hash(content_hash: str, limit: int = 100, db: "AsyncIOMotorDatabase" = Depends(get_database)):
+    resources = await db["resources"].find({"content_hash": content_hash}).to_list(limit)
+    for r in resources:
+        r["_id"] = str(r["_id"])
+    return await resolve_contents(db, resources)
 
 @router.get("/{id}", response_description="Get a single resource", response_model=ResourceModel)
-async def show_resource(id: str, db: AsyncIOMotorDatabase = Depends(get_database)):
-    if (resource := await db["resources"].find_one({"_id": ObjectId(id)})) is not None:
+async def show_resource(id: str, db: "AsyncIOMotorDatabase" = Depends(get_database)):
+    if (resource := await db["resources"].find_one({"_id": ObjectId(id)})) is None:
+        resource = await archive.find_archived(db, ObjectId(id))
+    if resource is not None:
         resource["_id"] = str(resource["_id"])
+        await resolve_contents(db, [resource])
         return resource
     raise HTTPException(status_code=404, detail=f"Resource {id} not found")
 
 @router.put("/{id}", response_description="Update a resource", response_model=ResourceModel)
-async def update_resource(id: str, resource: UpdateResourceModel = Body(...), db: AsyncIOMotorDatabase = Depends(get_database)):
+async def update_resource(
+    id: str,
+    resource: UpdateResourceModel = Body(...),
+    db: "AsyncIOMotorDatabase" = Depends(get_database),
+    settings: Settings = Depends(get_settings),
+):
+    from pymongo.errors import DuplicateKeyError
+
     resource_dict = {k: v for k, v in resource.model_dump().items() if v is not None}
+    # Updating an archived resource brings it back into the hot collection
+    try:
+        await archive.restore(db, ObjectId(id))
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Archived resource {id} conflicts with an existing resource",
+        )
+    update = {"$set": resource_dict}
+    current = None
+    old_ref = None
+
+    if "content" in resource_dict or "type" in resource_dict:
+        # Needed to adjust the stats counters and release the previous blob
+        if (current := await db["resources"].find_one({"_id": ObjectId(id)})) is None:
+            raise HTTPException(status_code=404, detail=f"Resource {id} not found")
+        old_ref = current.get("content_ref")
+
+    if "content" in resource_dict:
+        resource_dict["content_size"] = stats.content_size(resource_dict["content"])
+
+    if "content" in resource_dict and settings.DEDUP_MODE != "off":
+        content_hash = compute_content_hash(resource_dict["content"])
+        resource_dict["content_hash"] = content_hash
+
+        if settings.DEDUP_MODE == "reference":
+            await acquire_blob(db, content_hash, resource_dict.pop("content"))
+            resource_dict["content_ref"] = content_hash
+            update["$unset"] = {"content": ""}
 
     if len(resource_dict) >= 1:
-        update_result = await db["resources"].update_one({"_id": ObjectId(id)}, {"$set": resource_dict})
+        try:
+            update_result = await db["resources"].update_one({"_id": ObjectId(id)}, update)
+        except Exception as e:
+            if "content_ref" in resource_dict:
+                await release_blob(db, resource_dict["content_ref"])
+            if isinstance(e, DuplicateKeyError):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Resource with identical content already exists",
+                )
+            raise
+
+        if "content_ref" in resource_dict:
+            # The new blob reference was taken up front; drop whichever one is no longer used
+            if update_result.matched_count != 1:
+                await release_blob(db, resource_dict["content_ref"])
+            elif old_ref:
+                await release_blob(db, old_ref)
+
+        if current is not None and update_result.matched_count == 1:
+            await stats.record_update(
+                db,
+                current["type"], stats.stored_size(current),
+                resource_dict.get("type", current["type"]), resource_dict.get("content_size", stats.stored_size(current)),
+            )
 
         if update_result.modified_count == 1:
             if (updated_resource := await db["resources"].find_one({"_id": ObjectId(id)})) is not None:
                 updated_resource["_id"] = str(updated_resource["_id"])
+                await resolve_contents(db, [updated_resource])
                 return updated_resource
 
     if (existing_resource := await db["resources"].find_one({"_id": ObjectId(id)})) is not None:
         existing_resource["_id"] = str(existing_resource["_id"])
+        await resolve_contents(db, [existing_resource])
         return existing_resource
 
     raise HTTPException(status_code=404, detail=f"Resource {id} not found")
 
 @router.delete("/{id}", response_description="Delete a resource")
-async def delete_resource(id: str, db: AsyncIOMotorDatabase = Depends(get_database)):
-    delete_result = await db["resources"].delete_one({"_id": ObjectId(id)})
+async def delete_resource(id: str, db: "AsyncIOMotorDatabase" = Depends(get_database)):
+    if (deleted := await db["resources"].find_one_and_delete({"_id": ObjectId(id)})) is None:
+        deleted = await db[archive.ARCHIVE_COLLECTION].find_one_and_delete({"_id": ObjectId(id)})
 
-    if delete_result.deleted_count == 1:
+    if deleted is not None:
+        await stats.record_delete(db, deleted["type"], stats.stored_size(deleted))
+        if deleted.get("content_ref"):
+            await release_blob(db, deleted["content_ref"])
         return {"message": f"Resource {id} deleted"}
 
     raise HTTPException(status_code=404, detail=f"Resource {id} not found")
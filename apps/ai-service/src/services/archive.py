@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Optional
+from bson import ObjectId
+from loguru import logger
+from .stats import stored_size
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
+ARCHIVE_COLLECTION = "resources_archive"
+
+CREATED_AT_INDEX = "created_at"
+CONTENT_HASH_INDEX = "content_hash"
+# TTL index uses the descending key so it can coexist with the plain created_at index
+TTL_INDEX = "created_at_ttl"
+
+def parse_types(value: str) -> List[str]:
+    return [t.strip() for t in value.split(",") if t.strip()]
+
+
+async def ensure_collection(db: "AsyncIOMotorDatabase"):
+    """Create the archive collection with zstd block compression (WiredTiger)."""
+    from pymongo.errors import CollectionInvalid, OperationFailure
+
+    try:
+        await db.create_collection(
+            ARCHIVE_COLLECTION,
+            storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}},
+        )
+        logger.info(f"Created {ARCHIVE_COLLECTION} with zstd block compression")
+    except CollectionInvalid:
+        pass
+    except OperationFailure as e:
+        # Storage engines without WiredTiger options still get a plain collection
+        logger.warning(f"Could not enable zstd compression for {ARCHIVE_COLLECTION}: {e}")
+        try:
+            await db.create_collection(ARCHIVE_COLLECTION)
+        except CollectionInvalid:
+            pass
+
+
+async def ensure_indexes(db: "AsyncIOMotorDatabase", ttl_types: List[str], ttl_seconds: int):
+    """Index created_at for the archiver and keep the TTL index in sync with the settings."""
+    from pymongo import ASCENDING, DESCENDING
+
+    await db["resources"].create_index([("created_at", ASCENDING)], name=CREATED_AT_INDEX)
+    # Duplicate checks consult the archive too
+    await db[ARCHIVE_COLLECTION].create_index("content_hash", name=CONTENT_HASH_INDEX, sparse=True)
+
+    existing = (await db["resources"].index_information()).get(TTL_INDEX)
+    wanted = {"type": {"$in": ttl_types}} if ttl_types and ttl_seconds > 0 else None
+
+    if existing is not None and (
+        wanted is None
+        or existing.get("expireAfterSeconds") != ttl_seconds
+        or existing.get("partialFilterExpression") != wanted
+    ):
+        await db["resources"].drop_index(TTL_INDEX)
+        existing = None
+
+    if wanted is not None and existing is None:
+        await db["resources"].create_index(
+            [("created_at", DESCENDING)],
+            name=TTL_INDEX,
+            expireAfterSeconds=ttl_seconds,
+            partialFilterExpression=wanted,
+        )
+        logger.info(f"TTL of {ttl_seconds}s enabled for types: {', '.join(ttl_types)}")
+
+
+async def archive_batch(db: "AsyncIOMotorDatabase", cutoff: datetime, exclude_types: List[str], batch_size: int) -> int:
+    """Move one batch of resources created before `cutoff` into the archive collection."""
+    from pymongo import ASCENDING, ReplaceOne
+
+    query = {"created_at": {"$lt": cutoff}}
+    if exclude_types:
+        # Disposable types are left for the TTL index to expire
+        query["type"] = {"$nin": exclude_types}
+
+    batch = await db["resources"].find(query).sort("created_at", ASCENDING).to_list(batch_size)
+    if not batch:
+        return 0
+
+    archived_at = datetime.utcnow()
+    originals = [dict(doc) for doc in batch]
+    for doc in batch:
+        doc.setdefault("content_size", stored_size(doc))
+        doc["archived_at"] = archived_at
+
+    # Upsert so leftovers from an interrupted run are overwritten with what was just read
+    await db[ARCHIVE_COLLECTION].bulk_write(
+        [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in batch], ordered=False
+    )
+
+    # Only delete hot documents still exactly as read; anything updated in between stays hot
+    results = await asyncio.gather(*(db["resources"].delete_one(original) for original in originals))
+    stale = [doc["_id"] for doc, result in zip(batch, results) if result.deleted_count == 0]
+    if stale:
+        await db[ARCHIVE_COLLECTION].delete_many({"_id": {"$in": stale}, "archived_at": archived_at})
+    return len(batch) - len(stale)
+
+
+async def archive_cold(db: "AsyncIOMotorDatabase", after_days: int, exclude_types: List[str], batch_size: int) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=after_days)
+    total = 0
+    while (moved := await archive_batch(db, cutoff, exclude_types, batch_size)) > 0:
+        total += moved
+        if moved < batch_size:
+            break
+    if total:
+        logger.info(f"Archived {total} resources created before {cutoff.isoformat()}")
+    return total
+
+
+async def find_archived(db: "AsyncIOMotorDatabase", id: ObjectId) -> Optional[dict]:
+    return await db[ARCHIVE_COLLECTION].find_one({"_id": id})
+
+
+async def find_archived_by_hash(db: "AsyncIOMotorDatabase", content_hash: str) -> Optional[dict]:
+    return await db[ARCHIVE_COLLECTION].find_one({"content_hash": content_hash})
+
+
+async def restore(db: "AsyncIOMotorDatabase", id: ObjectId) -> bool:
+    """Move an archived resource back into the hot collection, e.g. before updating it."""
+    from pymongo.errors import DuplicateKeyError
+
+    if (doc := await db[ARCHIVE_COLLECTION].find_one({"_id": id})) is None:
+        return False
+    doc.pop("archived_at", None)
+    try:
+        await db["resources"].insert_one(doc)
+    except DuplicateKeyError:
+        # A hot copy of this resource makes the archived one redundant; a clash on any other
+        # unique key (e.g. content_hash) must keep the archived copy
+        if await db["resources"].find_one({"_id": id}) is None:
+            raise
+    await db[ARCHIVE_COLLECTION].delete_one({"_id": id})
+    return True
+
+
+async def run_archiver(db: "AsyncIOMotorDatabase", after_days: int, exclude_types: List[str], batch_size: int, interval: int):
+    while True:
+        try:
+            await archive_cold(db, after_days, exclude_types, batch_size)
+        except Exception as e:
+            logger.error(f"Resource archival failed: {e}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,72 @@
+import hashlib
+from typing import TYPE_CHECKING, List
+from loguru import logger
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
+BLOBS_COLLECTION = "resource_blobs"
+
+# Index names differ so switching modes never trips over an index with other options
+UNIQUE_HASH_INDEX = "content_hash_unique"
+SPARSE_HASH_INDEX = "content_hash_sparse"
+
+
+def compute_content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+async def ensure_indexes(db: "AsyncIOMotorDatabase", mode: str):
+    """Create the content_hash index matching the configured dedup mode."""
+    from pymongo.errors import OperationFailure
+
+    unique = mode in ("reject", "return_existing")
+    wanted, stale = (UNIQUE_HASH_INDEX, SPARSE_HASH_INDEX) if unique else (SPARSE_HASH_INDEX, UNIQUE_HASH_INDEX)
+
+    existing = await db["resources"].index_information()
+    try:
+        await db["resources"].create_index("content_hash", name=wanted, unique=unique, sparse=True)
+    except OperationFailure as e:
+        # Usually duplicates stored before the unique mode was turned on
+        logger.error(f"Could not create index {wanted}: {e}")
+        return
+    if stale in existing:
+        await db["resources"].drop_index(stale)
+
+
+async def acquire_blob(db: "AsyncIOMotorDatabase", content_hash: str, content: str):
+    """Store the content once and take a reference on it."""
+    await db[BLOBS_COLLECTION].update_one(
+        {"_id": content_hash},
+        {"$setOnInsert": {"content": content, "size": len(content.encode("utf-8"))}, "$inc": {"refcount": 1}},
+        upsert=True,
+    )
+
+
+async def release_blob(db: "AsyncIOMotorDatabase", content_hash: str):
+    """Drop a reference on a shared blob, deleting it once nothing points at it."""
+    from pymongo import ReturnDocument
+
+    blob = await db[BLOBS_COLLECTION].find_one_and_update(
+        {"_id": content_hash},
+        {"$inc": {"refcount": -1}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if blob is not None and blob["refcount"] <= 0:
+        await db[BLOBS_COLLECTION].delete_one({"_id": content_hash, "refcount": {"$lte": 0}})
+
+
+async def resolve_contents(db: "AsyncIOMotorDatabase", resources: List[dict]) -> List[dict]:
+    """Fill in `content` for resources that only hold a `content_ref`, in a single query."""
+    refs = {r["content_ref"] for r in resources if "content" not in r and r.get("content_ref")}
+    if not refs:
+        return resources
+
+    blobs = {}
+    async for blob in db[BLOBS_COLLECTION].find({"_id": {"$in": list(refs)}}):
+        blobs[blob["_id"]] = blob["content"]
+
+    for r in resources:
+        if "content" not in r and r.get("content_ref"):
+            r["content"] = blobs.get(r["content_ref"], "")
+    return resources
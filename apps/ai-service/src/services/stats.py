@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from loguru import logger
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
+STATS_COLLECTION = "resource_stats"
+# Archived resources still count; kept as a literal to avoid a circular import
+ARCHIVE_COLLECTION = "resources_archive"
+
+# Counters live in one small document per bucket ("type:<name>", "day:<YYYY-MM-DD>")
+# so arbitrary type names never end up inside a field path.
+TYPE_PREFIX = "type:"
+DAY_PREFIX = "day:"
+META_ID = "meta"
+
+
+def content_size(content: str) -> int:
+    return len(content.encode("utf-8"))
+
+
+def stored_size(resource: dict) -> int:
+    """Size recorded on write, falling back to measuring documents that predate it."""
+    if "content_size" in resource:
+        return resource["content_size"]
+    return content_size(resource.get("content", ""))
+
+
+def _type_bucket(type_: str) -> str:
+    return f"{TYPE_PREFIX}{type_}"
+
+
+def _day_bucket(created_at: datetime) -> str:
+    return f"{DAY_PREFIX}{created_at.strftime('%Y-%m-%d')}"
+
+
+async def record_insert(db: "AsyncIOMotorDatabase", type_: str, size: int, created_at: datetime):
+    from pymongo import UpdateOne
+
+    await db[STATS_COLLECTION].bulk_write([
+        UpdateOne({"_id": _type_bucket(type_)}, {"$inc": {"count": 1, "content_bytes": size}, "$set": {"key": type_}}, upsert=True),
+        UpdateOne({"_id": _day_bucket(created_at)}, {"$inc": {"count": 1}}, upsert=True),
+    ], ordered=False)
+
+
+async def record_delete(db: "AsyncIOMotorDatabase", type_: str, size: int, count: int = 1):
+    await db[STATS_COLLECTION].update_one(
+        {"_id": _type_bucket(type_)}, {"$inc": {"count": -count, "content_bytes": -size}}, upsert=True
+    )
+
+
+async def record_update(db: "AsyncIOMotorDatabase", old_type: str, old_size: int, new_type: str, new_size: int):
+    from pymongo import UpdateOne
+
+    if old_type == new_type:
+        if old_size != new_size:
+            await db[STATS_COLLECTION].update_one(
+                {"_id": _type_bucket(new_type)}, {"$inc": {"content_bytes": new_size - old_size}}, upsert=True
+            )
+        return
+    await db[STATS_COLLECTION].bulk_write([
+        UpdateOne({"_id": _type_bucket(old_type)}, {"$inc": {"count": -1, "content_bytes": -old_size}}, upsert=True),
+        UpdateOne({"_id": _type_bucket(new_type)}, {"$inc": {"count": 1, "content_bytes": new_size}, "$set": {"key": new_type}}, upsert=True),
+    ], ordered=False)
+
+
+RECONCILE_PIPELINE = [
+    {"$unionWith": ARCHIVE_COLLECTION},
+    {"$facet": {
+        "by_type": [
+            {"$group": {
+                "_id": "$type",
+                "count": {"$sum": 1},
+                "content_bytes": {"$sum": {
+                    "$ifNull": ["$content_size", {"$strLenBytes": {"$ifNull": ["$content", ""]}}]
+                }},
+            }},
+        ],
+        "by_day": [
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                "count": {"$sum": 1},
+            }},
+        ],
+    }},
+]
+
+
+async def reconcile(db: "AsyncIOMotorDatabase"):
+    """Rebuild every counter from the hot and archived resources with one aggregation pass.
+
+    Increments racing with a reconciliation can be lost, and TTL expiry bypasses the
+    write handlers; the next run corrects both.
+    """
+    from pymongo import DeleteMany, ReplaceOne
+
+    result = await db["resources"].aggregate(RECONCILE_PIPELINE).to_list(1)
+    facets = result[0] if result else {"by_type": [], "by_day": []}
+
+    ops = [DeleteMany({"_id": {"$regex": f"^({TYPE_PREFIX}|{DAY_PREFIX})"}})]
+    for row in facets["by_type"]:
+        ops.append(ReplaceOne(
+            {"_id": _type_bucket(row["_id"])},
+            {"key": row["_id"], "count": row["count"], "content_bytes": row["content_bytes"]},
+            upsert=True,
+        ))
+    for row in facets["by_day"]:
+        if row["_id"] is not None:
+            ops.append(ReplaceOne({"_id": f"{DAY_PREFIX}{row['_id']}"}, {"count": row["count"]}, upsert=True))
+    ops.append(ReplaceOne({"_id": META_ID}, {"reconciled_at": datetime.utcnow()}, upsert=True))
+
+    await db[STATS_COLLECTION].bulk_write(ops, ordered=True)
+    logger.info(f"Reconciled resource stats ({len(facets['by_type'])} types, {len(facets['by_day'])} days)")
+
+
+async def get_stats(db: "AsyncIOMotorDatabase", days: int = 30) -> dict:
+    """Serve the pre-aggregated counters; cost depends on the number of types and days, not documents."""
+    total = await db["resources"].estimated_document_count() + await db[ARCHIVE_COLLECTION].estimated_document_count()
+
+    by_type, content_bytes = {}, 0
+    async for doc in db[STATS_COLLECTION].find({"_id": {"$regex": f"^{TYPE_PREFIX}"}}):
+        if doc.get("count", 0) > 0:
+            by_type[doc["key"]] = doc["count"]
+        content_bytes += doc.get("content_bytes", 0)
+
+    since = _day_bucket(datetime.utcnow() - timedelta(days=days - 1))
+    created_per_day = {}
+    async for doc in db[STATS_COLLECTION].find({"_id": {"$gte": since, "$lt": f"{DAY_PREFIX}~"}}).sort("_id", 1):
+        created_per_day[doc["_id"][len(DAY_PREFIX):]] = doc["count"]
+
+    meta = await db[STATS_COLLECTION].find_one({"_id": META_ID})
+
+    return {
+        "total": total,
+        "content_bytes": content_bytes,
+        "by_type": by_type,
+        "created_per_day": created_per_day,
+        "reconciled_at": meta["reconciled_at"] if meta else None,
+    }
+
+
+async def run_reconciler(db: "AsyncIOMotorDatabase", interval: int):
+    """Background loop: reconcile right away on a fresh deployment, then every `interval` seconds."""
+    await _safe_reconcile(db, only_if_missing=True)
+    while True:
+        await asyncio.sleep(interval)
+        await _safe_reconcile(db)
+
+
+async def _safe_reconcile(db: "AsyncIOMotorDatabase", only_if_missing: bool = False):
+    try:
+        if only_if_missing and await db[STATS_COLLECTION].find_one({"_id": META_ID}) is not None:
+            return
+        await reconcile(db)
+    except Exception as e:
+        logger.error(f"Resource stats reconciliation failed: {e}")
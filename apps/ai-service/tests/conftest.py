@@ -0,0 +1,4 @@
+import os
+
+# Settings require a MongoDB URL; the client connects lazily, so no server is needed for these tests
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
@@ -0,0 +1,173 @@
+"""In-memory stand-in for the subset of Motor used by the services and routers."""
+import copy
+import re
+from types import SimpleNamespace
+from bson import ObjectId
+from pymongo import DeleteMany, DeleteOne, ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+
+def _matches_value(value, condition):
+    if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+        for op, arg in condition.items():
+            if op == "$in" and value not in arg:
+                return False
+            if op == "$nin" and value in arg:
+                return False
+            if op == "$lt" and not (value is not None and value < arg):
+                return False
+            if op == "$lte" and not (value is not None and value <= arg):
+                return False
+            if op == "$gt" and not (value is not None and value > arg):
+                return False
+            if op == "$gte" and not (value is not None and value >= arg):
+                return False
+            if op == "$regex" and not (isinstance(value, str) and re.search(arg, value)):
+                return False
+        return True
+    return value == condition
+
+
+def matches(doc, query):
+    return all(_matches_value(doc.get(field), condition) for field, condition in (query or {}).items())
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction=1):
+        self.docs.sort(key=lambda d: d.get(key), reverse=direction == -1)
+        return self
+
+    async def to_list(self, length):
+        return self.docs if length is None else self.docs[:length]
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+        self.unique_fields = set()
+
+    def _check_unique(self, doc, ignore_id=None):
+        if doc["_id"] in self.docs and doc["_id"] != ignore_id:
+            raise DuplicateKeyError("duplicate _id")
+        for field in self.unique_fields:
+            if doc.get(field) is None:
+                continue
+            for other in self.docs.values():
+                if other["_id"] != doc["_id"] and other.get(field) == doc[field]:
+                    raise DuplicateKeyError(f"duplicate {field}")
+
+    def _first(self, query):
+        return next((d for d in self.docs.values() if matches(d, query)), None)
+
+    async def insert_one(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self._check_unique(doc)
+        self.docs[doc["_id"]] = copy.deepcopy(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs, ordered=True):
+        for doc in docs:
+            await self.insert_one(doc)
+
+    async def find_one(self, query=None):
+        doc = self._first(query)
+        return copy.deepcopy(doc) if doc is not None else None
+
+    def find(self, query=None):
+        return FakeCursor([copy.deepcopy(d) for d in self.docs.values() if matches(d, query)])
+
+    def _apply(self, doc, update, inserting=False):
+        new = copy.deepcopy(doc)
+        for field, value in update.get("$set", {}).items():
+            new[field] = value
+        for field, value in update.get("$inc", {}).items():
+            new[field] = new.get(field, 0) + value
+        for field in update.get("$unset", {}):
+            new.pop(field, None)
+        if inserting:
+            new.update(update.get("$setOnInsert", {}))
+        return new
+
+    async def update_one(self, query, update, upsert=False):
+        doc = self._first(query)
+        if doc is None:
+            if not upsert:
+                return SimpleNamespace(matched_count=0, modified_count=0)
+            base = {k: v for k, v in query.items() if not isinstance(v, dict)}
+            base.setdefault("_id", ObjectId())
+            new = self._apply(base, update, inserting=True)
+            self._check_unique(new)
+            self.docs[new["_id"]] = new
+            return SimpleNamespace(matched_count=0, modified_count=0)
+        new = self._apply(doc, update)
+        self._check_unique(new, ignore_id=doc["_id"])
+        self.docs[doc["_id"]] = new
+        return SimpleNamespace(matched_count=1, modified_count=int(new != doc))
+
+    async def replace_one(self, query, replacement, upsert=False):
+        doc = self._first(query)
+        if doc is None and not upsert:
+            return
+        _id = doc["_id"] if doc is not None else query.get("_id", ObjectId())
+        self.docs[_id] = {"_id": _id, **copy.deepcopy(replacement)}
+
+    async def find_one_and_update(self, query, update, return_document=ReturnDocument.BEFORE):
+        before = await self.find_one(query)
+        if before is None:
+            return None
+        await self.update_one({"_id": before["_id"]}, update)
+        return before if return_document == ReturnDocument.BEFORE else await self.find_one({"_id": before["_id"]})
+
+    async def find_one_and_delete(self, query):
+        doc = self._first(query)
+        if doc is None:
+            return None
+        return self.docs.pop(doc["_id"])
+
+    async def delete_one(self, query):
+        doc = self._first(query)
+        if doc is None:
+            return SimpleNamespace(deleted_count=0)
+        del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=1)
+
+    async def delete_many(self, query):
+        ids = [d["_id"] for d in self.docs.values() if matches(d, query)]
+        for _id in ids:
+            del self.docs[_id]
+        return SimpleNamespace(deleted_count=len(ids))
+
+    async def bulk_write(self, ops, ordered=True):
+        for op in ops:
+            if isinstance(op, UpdateOne):
+                await self.update_one(op._filter, op._doc, upsert=op._upsert)
+            elif isinstance(op, ReplaceOne):
+                await self.replace_one(op._filter, op._doc, upsert=op._upsert)
+            elif isinstance(op, DeleteOne):
+                await self.delete_one(op._filter)
+            elif isinstance(op, DeleteMany):
+                await self.delete_many(op._filter)
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, FakeCollection())
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+from src.config import Settings
+from src.models.resource import ResourceModel, UpdateResourceModel
+from src.routers.resources import create_resource, update_resource
+from src.services import archive
+from src.services.content_store import compute_content_hash
+from .fake_db import FakeDatabase
+
+def run(coro):
+    return asyncio.run(coro)
+
+def cold(name, content="c", days=100):
+    return {
+        "_id": ObjectId(),
+        "name": name,
+        "type": "text",
+        "content": content,
+        "content_hash": content,
+        "created_at": datetime.utcnow() - timedelta(days=days),
+    }
+
+def archive_cold(db):
+    return run(archive.archive_cold(db, after_days=30, exclude_types=[], batch_size=10))
+
+def test_archive_moves_cold_resources():
+    db = FakeDatabase()
+    old, new = cold("old"), cold("new", days=1)
+    db["resources"].docs.update({old["_id"]: old, new["_id"]: new})
+
+    assert archive_cold(db) == 1
+    assert list(db["resources"].docs) == [new["_id"]]
+    assert db[archive.ARCHIVE_COLLECTION].docs[old["_id"]]["content_size"] == 1
+
+def test_archive_keeps_resources_updated_during_the_batch():
+    db = FakeDatabase()
+    doc = cold("before")
+    db["resources"].docs[doc["_id"]] = doc
+    archive_collection = db[archive.ARCHIVE_COLLECTION]
+    bulk_write = archive_collection.bulk_write
+
+    async def update_while_archiving(ops, ordered=True):
+        await bulk_write(ops, ordered=ordered)
+        await db["resources"].update_one({"_id": doc["_id"]}, {"$set": {"name": "after"}})
+
+    archive_collection.bulk_write = update_while_archiving
+    assert archive_cold(db) == 0
+    assert db["resources"].docs[doc["_id"]]["name"] == "after"
+    assert archive_collection.docs == {}
+
+def test_restore_keeps_archived_copy_on_foreign_duplicate():
+    db = FakeDatabase()
+    db["resources"].unique_fields.add("content_hash")
+    archived = cold("archived", content="same")
+    db[archive.ARCHIVE_COLLECTION].docs[archived["_id"]] = archived
+    run(db["resources"].insert_one(cold("hot", content="same")))
+
+    with pytest.raises(DuplicateKeyError):
+        run(archive.restore(db, archived["_id"]))
+    assert archived["_id"] in db[archive.ARCHIVE_COLLECTION].docs
+
+    with pytest.raises(HTTPException) as exc:
+        run(update_resource(str(archived["_id"]), UpdateResourceModel(name="x"), db=db, settings=Settings()))
+    assert exc.value.status_code == 409
+    assert archived["_id"] in db[archive.ARCHIVE_COLLECTION].docs
+
+def test_restore_drops_archived_copy_when_hot_copy_exists():
+    db = FakeDatabase()
+    doc = cold("both")
+    db["resources"].docs[doc["_id"]] = dict(doc)
+    db[archive.ARCHIVE_COLLECTION].docs[doc["_id"]] = dict(doc)
+
+    assert run(archive.restore(db, doc["_id"])) is True
+    assert doc["_id"] in db["resources"].docs
+    assert db[archive.ARCHIVE_COLLECTION].docs == {}
+
+def test_reject_mode_detects_archived_duplicate():
+    db = FakeDatabase()
+    archived = cold("archived", content="same")
+    archived["content_hash"] = compute_content_hash("same")
+    db[archive.ARCHIVE_COLLECTION].docs[archived["_id"]] = archived
+
+    with pytest.raises(HTTPException) as exc:
+        run(create_resource(ResourceModel(name="n", type="text", content="same"), db=db, settings=Settings(DEDUP_MODE="reject")))
+    assert exc.value.status_code == 409
+    assert db["resources"].docs == {}
@@ -0,0 +1,55 @@
+import gzip
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from src.middleware.compression import CompressionMiddleware, negotiate
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+@app.get("/large")
+async def large():
+    return PlainTextResponse("x" * 1000)
+
+@app.get("/small")
+async def small():
+    return PlainTextResponse("tiny")
+
+@app.get("/stream")
+async def stream():
+    async def chunks():
+        for i in range(10):
+            yield f"chunk-{i};" * 20
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+client = TestClient(app)
+
+def test_negotiate_prefers_highest_q_then_server_order():
+    supported = ("zstd", "br", "gzip")
+    assert negotiate("gzip, br", supported) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", supported) == "gzip"
+    assert negotiate("*", supported) == "zstd"
+    assert negotiate("identity", supported) is None
+    assert negotiate("gzip;q=0", supported) is None
+
+def test_large_response_is_gzipped():
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.text == "x" * 1000
+
+def test_small_response_is_not_compressed():
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "tiny"
+
+def test_no_accept_encoding_is_not_compressed():
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+def test_streaming_response_is_compressed_incrementally():
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    assert gzip.decompress(raw).decode() == "".join(f"chunk-{i};" * 20 for i in range(10))
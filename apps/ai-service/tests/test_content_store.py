@@ -0,0 +1,9 @@
+import hashlib
+from src.services.content_store import compute_content_hash
+
+def test_compute_content_hash_is_sha256_of_utf8():
+    assert compute_content_hash("olá") == hashlib.sha256("olá".encode("utf-8")).hexdigest()
+
+def test_compute_content_hash_is_stable():
+    assert compute_content_hash("same") == compute_content_hash("same")
+    assert compute_content_hash("same") != compute_content_hash("other")
@@ -1,5 +1,9 @@
+import asyncio
 from fastapi.testclient import TestClient
+from src import main
+from src.config import Settings
 from src.main import app
+from .fake_db import FakeDatabase
 
 client = TestClient(app)
 
@@ -7,3 +11,16 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok", "service": "ai-service"}
+
+def test_index_setup_retries_until_mongodb_answers(monkeypatch):
+    attempts = []
+
+    async def flaky_ensure_indexes(database, mode):
+        attempts.append(mode)
+        if len(attempts) < 3:
+            raise ConnectionError("MongoDB unreachable")
+
+    monkeypatch.setattr(main, "ensure_indexes", flaky_ensure_indexes)
+    monkeypatch.setattr(main, "INDEX_RETRY_DELAY", 0)
+    asyncio.run(main.ensure_database_indexes(FakeDatabase(), Settings(), []))
+    assert len(attempts) == 3
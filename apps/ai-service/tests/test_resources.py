@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from src.config import Settings
+from src.models.resource import ResourceModel, UpdateResourceModel
+from src.routers.resources import create_resource, delete_resource, update_resource
+from src.services.content_store import BLOBS_COLLECTION
+from .fake_db import FakeDatabase
+
+def run(coro):
+    return asyncio.run(coro)
+
+def create(db, mode, content, name="r"):
+    resource = ResourceModel(name=name, type="text", content=content)
+    return run(create_resource(resource, db=db, settings=Settings(DEDUP_MODE=mode)))
+
+def blobs(db):
+    return {blob["_id"]: blob["refcount"] for blob in db[BLOBS_COLLECTION].docs.values()}
+
+def test_reject_mode_returns_409_for_duplicate_content():
+    db = FakeDatabase()
+    create(db, "reject", "same")
+    with pytest.raises(HTTPException) as exc:
+        create(db, "reject", "same")
+    assert exc.value.status_code == 409
+    assert len(db["resources"].docs) == 1
+
+def test_return_existing_mode_returns_stored_resource():
+    db = FakeDatabase()
+    first = create(db, "return_existing", "same", name="first")
+    second = create(db, "return_existing", "same", name="second")
+    assert second["_id"] == first["_id"]
+    assert second["name"] == "first"
+    assert len(db["resources"].docs) == 1
+
+def test_return_existing_mode_recovers_from_insert_race():
+    db = FakeDatabase()
+    db["resources"].unique_fields.add("content_hash")
+    first = create(db, "return_existing", "same")
+
+    async def racing_find_one(query=None, _orig=db["resources"].find_one):
+        # The pre-insert lookup misses the concurrent insert, the unique index catches it
+        if "content_hash" in (query or {}) and not racing_find_one.seen:
+            racing_find_one.seen = True
+            return None
+        return await _orig(query)
+    racing_find_one.seen = False
+    db["resources"].find_one = racing_find_one
+
+    assert create(db, "return_existing", "same")["_id"] == first["_id"]
+
+def test_reference_mode_shares_blob_and_resolves_content():
+    db = FakeDatabase()
+    a = create(db, "reference", "shared")
+    b = create(db, "reference", "shared")
+    assert a["_id"] != b["_id"]
+    assert a["content"] == b["content"] == "shared"
+    assert list(blobs(db).values()) == [2]
+    assert all("content" not in doc for doc in db["resources"].docs.values())
+
+def test_reference_mode_releases_blobs_on_update_and_delete():
+    db = FakeDatabase()
+    settings = Settings(DEDUP_MODE="reference")
+    a = create(db, "reference", "old")
+    b = create(db, "reference", "old")
+
+    updated = run(update_resource(a["_id"], UpdateResourceModel(content="new"), db=db, settings=settings))
+    assert updated["content"] == "new"
+    assert sorted(blobs(db).values()) == [1, 1]
+
+    run(delete_resource(b["_id"], db=db))
+    run(delete_resource(a["_id"], db=db))
+    assert blobs(db) == {}
+
+def test_reference_mode_releases_blob_when_insert_fails():
+    db = FakeDatabase()
+
+    async def failing_insert(doc):
+        raise RuntimeError("insert failed")
+    db["resources"].insert_one = failing_insert
+
+    with pytest.raises(RuntimeError):
+        create(db, "reference", "content")
+    assert blobs(db) == {}
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from src.database import get_database
+from src.main import app
+from src.services import stats
+from .fake_db import FakeDatabase
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_content_size_counts_utf8_bytes():
+    assert stats.content_size("abc") == 3
+    assert stats.content_size("olá") == 4
+
+def test_stored_size_prefers_recorded_size():
+    assert stats.stored_size({"content_size": 10, "content": "abc"}) == 10
+    assert stats.stored_size({"content_size": 0, "content": "abc"}) == 0
+    assert stats.stored_size({"content": "abc"}) == 3
+    assert stats.stored_size({"content_ref": "hash"}) == 0
+
+def test_record_update_adjusts_counters():
+    db = FakeDatabase()
+    now = datetime.utcnow()
+    run(stats.record_insert(db, "a", 10, now))
+    run(stats.record_insert(db, "a", 5, now))
+
+    run(stats.record_update(db, "a", 10, "a", 4))
+    bucket = db[stats.STATS_COLLECTION].docs["type:a"]
+    assert (bucket["count"], bucket["content_bytes"]) == (2, 9)
+
+    run(stats.record_update(db, "a", 4, "b", 7))
+    buckets = db[stats.STATS_COLLECTION].docs
+    assert (buckets["type:a"]["count"], buckets["type:a"]["content_bytes"]) == (1, 5)
+    assert (buckets["type:b"]["count"], buckets["type:b"]["content_bytes"]) == (1, 7)
+
+    run(stats.record_delete(db, "b", 7))
+    assert (buckets["type:b"]["count"], buckets["type:b"]["content_bytes"]) == (0, 0)
+
+def test_get_stats_parses_buckets():
+    db = FakeDatabase()
+    today = datetime.utcnow()
+    run(stats.record_insert(db, "text", 3, today))
+    run(stats.record_insert(db, "odd:type.$name", 2, today - timedelta(days=1)))
+    run(stats.record_insert(db, "text", 1, today - timedelta(days=40)))
+    run(stats.record_insert(db, "gone", 8, today))
+    run(stats.record_delete(db, "gone", 8))
+    db["resources"].docs.update({i: {"_id": i} for i in range(3)})
+
+    result = run(stats.get_stats(db, days=2))
+    assert result["total"] == 3
+    assert result["content_bytes"] == 6
+    assert result["by_type"] == {"text": 2, "odd:type.$name": 1}
+    assert result["created_per_day"] == {
+        (today - timedelta(days=1)).strftime("%Y-%m-%d"): 1,
+        today.strftime("%Y-%m-%d"): 2,
+    }
+    assert result["reconciled_at"] is None
+
+def test_stats_endpoint_rejects_out_of_range_days():
+    app.dependency_overrides[get_database] = FakeDatabase
+    try:
+        client = TestClient(app)
+        assert client.get("/resources/stats?days=0").status_code == 422
+        assert client.get("/resources/stats?days=100000000").status_code == 422
+        assert client.get("/resources/stats?days=7").status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+def test_reconciler_survives_unreachable_database(monkeypatch):
+    db = FakeDatabase()
+
+    async def unreachable(query=None):
+        raise ConnectionError("MongoDB unreachable")
+
+    db[stats.STATS_COLLECTION].find_one = unreachable
+    run(stats._safe_reconcile(db, only_if_missing=True))
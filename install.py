@@ -17,6 +17,9 @@ Usage:
     python install.py --update       # Update existing installation
     python install.py --dev          # Development mode
     python install.py --no-docker    # Skip Docker
+    python install.py --jobs 1       # Run steps one after another
+    python install.py --timings-json timings.json  # Save per-step timings
+    python install.py --update --force  # Re-run steps even if nothing changed
 
 Requirements:
     - Python 3.7+
@@ -28,7 +31,12 @@ import platform
 import subprocess
 import shutil
 import argparse
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import json
@@ -41,6 +49,19 @@ MIN_PYTHON_VERSION = (3, 7)
 MIN_NODE_VERSION = "18.0.0"
 MIN_NPM_VERSION = "10.0.0"
 MIN_DOCKER_VERSION = "20.10.0"
+DEFAULT_JOBS = 4
+STATE_FILE = '.openpanel-install-state.json'
+SERVICE_READY_TIMEOUT = 120
+POSTGRES_CONTAINER = 'openpanel-postgres'
+# Containers started by `docker compose up -d` without profiles, used when they cannot be listed
+COMPOSE_CONTAINERS = [
+    'openpanel-postgres',
+    'openpanel-redis',
+    'openpanel-traefik',
+    'openpanel-mongo',
+    'openpanel-ai-service',
+    'openpanel-mcp-server',
+]
 
 # Colors
 class Colors:
@@ -62,16 +83,25 @@ INFO = f"{Colors.CYAN}ℹ{Colors.ENDC}"
 # ============================================
 # LOGGING SETUP
 # ============================================
+class ConsoleStepFilter(logging.Filter):
+    """Keep records of parallel steps off the console; their output is printed grouped per step"""
+
+    def filter(self, record):
+        return not getattr(record, 'grouped', False)
+
 def setup_logging(script_dir):
     """Setup logging to file and console"""
     log_file = script_dir / "install.log"
 
+    console = logging.StreamHandler()
+    console.addFilter(ConsoleStepFilter())
+
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(message)s',
         handlers=[
             logging.FileHandler(log_file),
-            logging.StreamHandler()
+            console
         ]
     )
 
@@ -99,7 +129,7 @@ def print_header():
     print("╚═══════════════════════════════════════════════════════════════╝")
     print(f"{Colors.ENDC}\n")
 
-def run_command(cmd, check=True, capture_output=True, shell=False):
+def run_command(cmd, check=True, capture_output=True, shell=False, cwd=None):
     """Run shell command and return result"""
     try:
         if isinstance(cmd, str) and not shell:
@@ -110,7 +140,8 @@ def run_command(cmd, check=True, capture_output=True, shell=False):
             check=check,
             capture_output=capture_output,
             text=True,
-            shell=shell
+            shell=shell,
+            cwd=cwd
         )
         return result
     except subprocess.CalledProcessError as e:
@@ -131,8 +162,9 @@ def compare_versions(version1, version2):
 
     return normalize(version1) >= normalize(version2)
 
+@lru_cache(maxsize=None)
 def get_installed_version(cmd):
-    """Get installed version of a command"""
+    """Get installed version of a command (probed once per run)"""
     try:
         if cmd == 'node':
             result = run_command(['node', '-v'], check=False)
@@ -156,6 +188,353 @@ def get_installed_version(cmd):
 
     return None
 
+@lru_cache(maxsize=None)
+def docker_daemon_running():
+    """Check whether the Docker daemon answers (probed once per run)"""
+    result = run_command(['docker', 'info'], check=False)
+    return bool(result and result.returncode == 0)
+
+def file_fingerprint(*paths):
+    """SHA-256 over the given files; missing files hash as empty"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path.name).encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+# ============================================
+# INSTALL STATE
+# ============================================
+class InstallState:
+    """Fingerprints of the inputs of each step that last completed, kept between runs"""
+
+    def __init__(self, path, ignore=False):
+        self.path = path
+        self.data = {}
+        self._lock = threading.Lock()
+
+        if not ignore and path.exists():
+            try:
+                self.data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                self.data = {}
+
+    def is_current(self, step, fingerprint):
+        return self.data.get(step) == fingerprint
+
+    def record(self, step, fingerprint):
+        with self._lock:
+            self.data[step] = fingerprint
+            tmp = self.path.with_name(self.path.name + '.tmp')
+            tmp.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+            os.replace(tmp, self.path)
+
+# ============================================
+# STEP SCHEDULER
+# ============================================
+class Step:
+    """Installer step with the steps it must wait for"""
+
+    def __init__(self, name, func, depends_on=(), phase=None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.phase = phase or name
+        self.result = None
+        self.status = 'pending'
+        self.started = None
+        self.finished = None
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+class StepScheduler:
+    """Run a dependency graph of steps on a thread pool.
+
+    A step starts as soon as all of its dependencies succeeded. With more than one
+    worker, each step's output is buffered and printed as one block when it ends.
+    """
+
+    def __init__(self, steps, jobs, on_output):
+        self.steps = {step.name: step for step in steps}
+        self.jobs = max(1, jobs)
+        self.on_output = on_output
+        self.started = None
+        self.finished = None
+
+        for step in steps:
+            for dep in step.depends_on:
+                if dep not in self.steps:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+        self._check_cycles()
+
+    def _check_cycles(self):
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through step '{name}'")
+            visiting.add(name)
+            for dep in self.steps[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.steps:
+            visit(name)
+
+    @property
+    def grouped(self):
+        return self.jobs > 1
+
+    def _ready(self, pending, succeeded):
+        return [
+            name for name in pending
+            if all(dep in succeeded for dep in self.steps[name].depends_on)
+        ]
+
+    def _execute(self, step):
+        step.started = time.perf_counter()
+        step.status = 'running'
+        self.on_output.begin(step.name, self.grouped)
+        try:
+            step.result = step.func()
+            step.status = 'ok'
+            return step.result
+        except BaseException:
+            step.status = 'failed'
+            raise
+        finally:
+            step.finished = time.perf_counter()
+            self.on_output.end(step.name, step.duration, step.status)
+
+    def run(self):
+        """Run every step; re-raises the first failure after running steps settle"""
+        self.started = time.perf_counter()
+        pending = list(self.steps)
+        succeeded = set()
+        running = {}
+        failure = None
+
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            while pending or running:
+                if failure is None:
+                    for name in self._ready(pending, succeeded):
+                        pending.remove(name)
+                        running[executor.submit(self._execute, self.steps[name])] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        succeeded.add(name)
+                    except BaseException as e:
+                        if failure is None:
+                            failure = e
+        finally:
+            executor.shutdown(wait=True)
+            self.finished = time.perf_counter()
+
+        for name in pending:
+            self.steps[name].status = 'skipped'
+
+        if failure is not None:
+            raise failure
+
+        return {name: step.result for name, step in self.steps.items()}
+
+    def timings(self):
+        """Per-step timings relative to the start of the run"""
+        total = (self.finished or time.perf_counter()) - self.started
+        steps = []
+        for step in self.steps.values():
+            steps.append({
+                'name': step.name,
+                'phase': step.phase,
+                'depends_on': list(step.depends_on),
+                'status': step.status,
+                'start': round(step.started - self.started, 3) if step.started else None,
+                'duration': round(step.duration, 3),
+            })
+        return {
+            'jobs': self.jobs,
+            'total_seconds': round(total, 3),
+            'serial_seconds': round(sum(step.duration for step in self.steps.values()), 3),
+            'steps': steps,
+        }
+
+class StepOutput:
+    """Collects console output per step so parallel steps do not interleave"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def current_step(self):
+        return getattr(self._local, 'step', None)
+
+    @property
+    def buffering(self):
+        return getattr(self._local, 'lines', None) is not None
+
+    def begin(self, step, grouped):
+        self._local.step = step
+        self._local.lines = [] if grouped else None
+
+    def end(self, step, duration, status):
+        lines = getattr(self._local, 'lines', None)
+        self._local.step = None
+        self._local.lines = None
+        if lines is None:
+            return
+
+        icon = CHECK if status == 'ok' else CROSS
+        with self.lock:
+            print(f"{Colors.BOLD}── {step}{Colors.ENDC} {icon} ({duration:.1f}s)")
+            for line in lines:
+                print(f"   {line}")
+            sys.stdout.flush()
+
+    def write(self, text):
+        if self.buffering:
+            self._local.lines.extend(text.rstrip('\n').splitlines())
+        else:
+            with self.lock:
+                print(text)
+
+    def prompt(self, question):
+        """Ask the user directly, holding the console so other steps cannot print over it"""
+        with self.lock:
+            return input(question)
+
+# ============================================
+# SERVICE READINESS
+# ============================================
+INSPECT_FORMAT = '{{.Name}}|{{.State.Status}}|{{if .State.Health}}{{.State.Health.Status}}{{end}}'
+
+def list_compose_containers(cwd):
+    """Names of the containers of the compose project, falling back to the known list"""
+    for cmd in (['docker', 'compose', 'ps', '-q'], ['docker-compose', 'ps', '-q']):
+        result = run_command(cmd, check=False, cwd=cwd)
+        if result and result.returncode == 0 and result.stdout.split():
+            inspected = run_command(['docker', 'inspect', '--format', INSPECT_FORMAT] + result.stdout.split(), check=False)
+            if inspected and inspected.stdout:
+                return [line.split('|')[0].lstrip('/') for line in inspected.stdout.splitlines() if line]
+    return list(COMPOSE_CONTAINERS)
+
+class ServiceReadinessWaiter:
+    """Wait for containers to become healthy.
+
+    Health transitions arrive through `docker events`; a `docker inspect` poll with
+    exponential backoff covers events missed before subscribing or a broken stream.
+    Containers without a healthcheck count as ready once running.
+    """
+
+    def __init__(self, containers, initial_delay=0.5, max_delay=8.0):
+        self.containers = list(containers)
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.started = time.perf_counter()
+        self.ready = {name: threading.Event() for name in self.containers}
+        self.timeline = []
+        self._last_status = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._events = None
+
+    def start(self):
+        # Subscribe before the first inspect so no transition falls in between
+        cmd = ['docker', 'events', '--format', '{{json .}}',
+               '--filter', 'type=container', '--filter', 'event=health_status']
+        for name in self.containers:
+            cmd += ['--filter', f'container={name}']
+        try:
+            self._events = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            threading.Thread(target=self._read_events, daemon=True).start()
+        except OSError:
+            self._events = None
+
+        threading.Thread(target=self._poll, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._events and self._events.poll() is None:
+            self._events.terminate()
+            try:
+                self._events.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._events.kill()
+
+    def pending(self):
+        return [name for name in self.containers if not self.ready[name].is_set()]
+
+    def wait_for(self, names, timeout=SERVICE_READY_TIMEOUT):
+        """Block until every container in `names` is ready; False on timeout"""
+        deadline = time.perf_counter() + timeout
+        for name in names:
+            if name not in self.ready:
+                continue
+            if not self.ready[name].wait(max(0.0, deadline - time.perf_counter())):
+                return False
+        return True
+
+    def _record(self, name, status, source):
+        with self._lock:
+            if name not in self.ready or self._last_status.get(name) == status:
+                return
+            self._last_status[name] = status
+            self.timeline.append((time.perf_counter() - self.started, name, status, source))
+            if status in ('healthy', 'running'):
+                self.ready[name].set()
+
+    def _read_events(self):
+        for line in self._events.stdout:
+            if self._stopped.is_set():
+                break
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            action = event.get('Action') or event.get('status') or ''
+            name = event.get('Actor', {}).get('Attributes', {}).get('name')
+            if name and action.startswith('health_status:'):
+                self._record(name, action.split(':', 1)[1].strip(), 'event')
+
+    def _inspect(self, names):
+        result = run_command(['docker', 'inspect', '--format', INSPECT_FORMAT] + names, check=False)
+        if not result or not result.stdout:
+            return
+        for line in result.stdout.splitlines():
+            parts = line.split('|')
+            if len(parts) != 3:
+                continue
+            name, state, health = parts[0].lstrip('/'), parts[1], parts[2]
+            self._record(name, health or state, 'poll')
+
+    def _poll(self):
+        delay = self.initial_delay
+        while not self._stopped.is_set():
+            names = self.pending()
+            if not names:
+                return
+            self._inspect(names)
+            if self._stopped.wait(delay):
+                return
+            delay = min(delay * 2, self.max_delay)
+
 # ============================================
 # OS DETECTION
 # ============================================
@@ -233,28 +612,55 @@ class OpenPanelInstaller:
         self.os = OSDetector()
         self.script_dir = Path(__file__).parent.absolute()
         self.backup_dir = None
+        self.output = StepOutput()
+        self.scheduler = None
+        self.readiness = None
+        self.state = InstallState(self.script_dir / STATE_FILE, ignore=args.force)
+        self.dependencies_installed = False
 
     def log(self, level, message, icon=None):
         """Log message with icon"""
         if icon:
-            print(f"{icon} {message}")
+            self.output.write(f"{icon} {message}")
         else:
             if level == 'success':
-                print(f"{CHECK} {message}")
+                self.output.write(f"{CHECK} {message}")
             elif level == 'error':
-                print(f"{CROSS} {Colors.RED}{message}{Colors.ENDC}")
+                self.output.write(f"{CROSS} {Colors.RED}{message}{Colors.ENDC}")
             elif level == 'warn':
-                print(f"{WARN} {Colors.YELLOW}{message}{Colors.ENDC}")
+                self.output.write(f"{WARN} {Colors.YELLOW}{message}{Colors.ENDC}")
             elif level == 'info':
-                print(f"{INFO} {Colors.CYAN}{message}{Colors.ENDC}")
+                self.output.write(f"{INFO} {Colors.CYAN}{message}{Colors.ENDC}")
 
-        # Also log to file
+        # Also log to file (tagged with the step when several run at once)
+        step = self.output.current_step
+        if step:
+            message = f"[{step}] {message}"
+        extra = {'grouped': self.output.buffering}
         if level == 'error':
-            self.logger.error(message)
+            self.logger.error(message, extra=extra)
         elif level == 'warn':
-            self.logger.warning(message)
+            self.logger.warning(message, extra=extra)
         else:
-            self.logger.info(message)
+            self.logger.info(message, extra=extra)
+
+    def run_visible(self, cmd, cwd=None):
+        """Run a command whose output the user should see.
+
+        Output streams straight to the terminal, except in parallel steps where it is
+        captured into the step's output block.
+        """
+        if not self.output.buffering:
+            return run_command(cmd, capture_output=False, cwd=cwd)
+
+        try:
+            result = run_command(cmd, capture_output=True, cwd=cwd)
+        except subprocess.CalledProcessError as e:
+            self.output.write((e.stdout or '') + (e.stderr or ''))
+            raise
+        if result is not None:
+            self.output.write((result.stdout or '') + (result.stderr or ''))
+        return result
 
     def install_nodejs(self):
         """Install or update Node.js"""
@@ -298,6 +704,7 @@ class OpenPanelInstaller:
             else:
                 self.log('warn', "npm version is too old. Updating...")
                 run_command(['npm', 'install', '-g', 'npm@latest'])
+                get_installed_version.cache_clear()
                 self.log('success', "npm updated")
 
     def check_docker(self):
@@ -310,10 +717,9 @@ class OpenPanelInstaller:
 
         if command_exists('docker'):
             # Check if Docker daemon is running
-            try:
-                run_command(['docker', 'info'], capture_output=True)
+            if docker_daemon_running():
                 self.log('success', "Docker is installed and running")
-            except:
+            else:
                 self.log('warn', "Docker is installed but not running")
                 self.log('info', "Please start Docker Desktop manually")
         else:
@@ -321,7 +727,7 @@ class OpenPanelInstaller:
             self.log('info', "Please install Docker Desktop from: https://www.docker.com/products/docker-desktop")
 
             if not self.args.no_docker:
-                response = input("Continue without Docker? (y/N): ")
+                response = self.output.prompt("Continue without Docker? (y/N): ")
                 if response.lower() != 'y':
                     sys.exit(1)
 
@@ -376,19 +782,38 @@ VITE_ENABLE_MONITORING=true
         else:
             self.log('info', "Frontend .env.local already exists")
 
+    def dependencies_fingerprint(self):
+        return {
+            'lockfile': file_fingerprint(self.script_dir / 'package.json', self.script_dir / 'package-lock.json'),
+            'node': get_installed_version('node'),
+            'npm': get_installed_version('npm'),
+        }
+
+    def prisma_fingerprint(self):
+        return file_fingerprint(
+            self.script_dir / 'apps' / 'api' / 'prisma' / 'schema.prisma',
+            self.script_dir / 'prisma.config.mjs',
+        )
+
     def install_dependencies(self):
         """Install npm dependencies"""
-        self.log('info', "Installing project dependencies...")
+        fingerprint = self.dependencies_fingerprint()
+        if (self.script_dir / 'node_modules').exists() and self.state.is_current('dependencies', fingerprint):
+            self.log('success', "Dependencies are up to date (package-lock.json and tools unchanged)")
+            return
 
-        os.chdir(self.script_dir)
+        self.log('info', "Installing project dependencies...")
 
         try:
             if self.args.update:
                 self.log('info', "Update mode: Running npm ci...")
-                run_command(['npm', 'ci'], capture_output=False)
+                self.run_visible(['npm', 'ci'], cwd=self.script_dir)
             else:
-                run_command(['npm', 'install'], capture_output=False)
+                self.run_visible(['npm', 'install'], cwd=self.script_dir)
 
+            self.dependencies_installed = True
+            # npm install may have rewritten package-lock.json
+            self.state.record('dependencies', self.dependencies_fingerprint())
             self.log('success', "Dependencies installed")
         except Exception as e:
             self.log('error', f"Failed to install dependencies: {e}")
@@ -404,15 +829,34 @@ VITE_ENABLE_MONITORING=true
         try:
             # Try docker compose v2 first, then v1
             try:
-                run_command(['docker', 'compose', 'up', '-d'], capture_output=False)
+                self.run_visible(['docker', 'compose', 'up', '-d'], cwd=self.script_dir)
             except:
-                run_command(['docker-compose', 'up', '-d'], capture_output=False)
+                self.run_visible(['docker-compose', 'up', '-d'], cwd=self.script_dir)
 
             self.log('success', "Docker services started")
         except Exception as e:
             self.log('warn', f"Failed to start Docker services: {e}")
             self.log('info', "You may need to start services manually with: docker compose up -d")
 
+        if command_exists('docker'):
+            self.readiness = ServiceReadinessWaiter(list_compose_containers(self.script_dir)).start()
+
+    def wait_for_services(self):
+        """Wait for every compose service to become healthy and print when each one did"""
+        if self.readiness is None:
+            return
+
+        self.log('info', f"Waiting for {len(self.readiness.containers)} services to become healthy...")
+        all_ready = self.readiness.wait_for(self.readiness.containers)
+        self.readiness.stop()
+
+        for elapsed, name, status, source in self.readiness.timeline:
+            level = 'success' if status in ('healthy', 'running') else 'warn'
+            self.log(level, f"{elapsed:6.1f}s  {name}: {status} ({source})")
+
+        if not all_ready:
+            self.log('warn', f"Not healthy after {SERVICE_READY_TIMEOUT}s: {', '.join(self.readiness.pending())}")
+
     def setup_database(self):
         """Setup database"""
         if self.args.no_docker:
@@ -421,46 +865,40 @@ VITE_ENABLE_MONITORING=true
 
         self.log('info', "Setting up database...")
 
-        import time
-
-        # Wait for PostgreSQL
+        # Wait for PostgreSQL only; the other services are awaited by wait_for_services
         self.log('info', "Waiting for PostgreSQL to be ready...")
-        max_wait = 60
-        waited = 0
-
-        while waited < max_wait:
-            try:
-                result = run_command(['docker', 'inspect', '--format={{.State.Health.Status}}', 'openpanel-postgres'], check=False)
-                if result and 'healthy' in result.stdout:
-                    self.log('success', "PostgreSQL is ready")
-                    break
-            except:
-                pass
-
-            time.sleep(2)
-            waited += 2
-            print(".", end="", flush=True)
-
-        print()
-
-        if waited >= max_wait:
+        if self.readiness is None or not self.readiness.wait_for([POSTGRES_CONTAINER]):
             self.log('warn', "PostgreSQL did not become healthy in time")
             return
+        self.log('success', "PostgreSQL is ready")
 
-        # Generate Prisma client
-        self.log('info', "Generating Prisma Client...")
         os.environ['PRISMA_ENGINES_CHECKSUM_IGNORE_MISSING'] = '1'
+        schema = self.prisma_fingerprint()
 
-        try:
-            run_command(['npm', 'run', 'db:generate'], capture_output=False)
-            self.log('success', "Prisma Client generated")
-        except:
-            self.log('warn', "Prisma Client generation failed (may need manual setup)")
+        # Generate Prisma client (a fresh node_modules never contains it)
+        generate = {'schema': schema, 'dependencies': self.state.data.get('dependencies')}
+        if not self.dependencies_installed and self.state.is_current('prisma_generate', generate):
+            self.log('success', "Prisma Client is up to date (schema unchanged)")
+        else:
+            self.log('info', "Generating Prisma Client...")
+            try:
+                self.run_visible(['npm', 'run', 'db:generate'], cwd=self.script_dir)
+                self.state.record('prisma_generate', generate)
+                self.log('success', "Prisma Client generated")
+            except:
+                self.log('warn', "Prisma Client generation failed (may need manual setup)")
+
+        # Push schema; a recreated container (e.g. after `down -v`) gets a new id and is synced again
+        container = run_command(['docker', 'inspect', '--format', '{{.Id}}', POSTGRES_CONTAINER], check=False)
+        push = {'schema': schema, 'container': container.stdout.strip() if container else None}
+        if self.state.is_current('prisma_push', push):
+            self.log('success', "Database schema is up to date (schema unchanged)")
+            return
 
-        # Push schema
         self.log('info', "Syncing database schema...")
         try:
-            run_command(['npm', 'run', 'db:push'], capture_output=False)
+            self.run_visible(['npm', 'run', 'db:push'], cwd=self.script_dir)
+            self.state.record('prisma_push', push)
             self.log('success', "Database schema synced")
         except:
             self.log('warn', "Database schema sync failed (may need manual setup)")
@@ -490,11 +928,10 @@ VITE_ENABLE_MONITORING=true
         # Check Docker
         if not self.args.no_docker:
             if command_exists('docker'):
-                try:
-                    run_command(['docker', 'info'], capture_output=True)
+                if docker_daemon_running():
                     version = get_installed_version('docker')
                     self.log('success', f"Docker {version} ✓")
-                except:
+                else:
                     self.log('warn', "Docker installed but not running ⚠")
             else:
                 self.log('warn', "Docker not found ⚠")
@@ -545,34 +982,75 @@ VITE_ENABLE_MONITORING=true
         print(f"   {INFO} Full Guide:  SETUP_GUIDE.md")
         print()
 
-    def run(self):
-        """Main installation flow"""
-        try:
-            # Step 1: Install/check Node.js
-            self.install_nodejs()
-
-            # Step 2: Update npm
-            self.update_npm()
+    def build_steps(self):
+        """Installation steps and what each one has to wait for"""
+        return [
+            Step('install_nodejs', self.install_nodejs, phase='prerequisites'),
+            Step('update_npm', self.update_npm, ['install_nodejs'], phase='prerequisites'),
+            Step('check_docker', self.check_docker, phase='prerequisites'),
+            Step('setup_environment', self.setup_environment, phase='environment'),
+            # npm install only needs npm; compose only needs Docker and the .env file
+            Step('install_dependencies', self.install_dependencies, ['update_npm'], phase='dependencies'),
+            Step('start_docker_services', self.start_docker_services,
+                 ['check_docker', 'setup_environment'], phase='services'),
+            Step('setup_database', self.setup_database,
+                 ['install_dependencies', 'start_docker_services'], phase='database'),
+            Step('wait_for_services', self.wait_for_services, ['start_docker_services'], phase='services'),
+            Step('verify_installation', self.verify_installation,
+                 ['setup_database', 'wait_for_services', 'setup_environment'], phase='verification'),
+        ]
 
-            # Step 3: Check Docker
-            self.check_docker()
+    def print_timings(self):
+        """Print how long each step and phase took, and save them as JSON if requested"""
+        timings = self.scheduler.timings()
+
+        phases = {}
+        for step in timings['steps']:
+            if step['start'] is None:
+                continue
+            start, end = step['start'], step['start'] + step['duration']
+            if step['phase'] in phases:
+                phase_start, phase_end = phases[step['phase']]
+                phases[step['phase']] = (min(start, phase_start), max(end, phase_end))
+            else:
+                phases[step['phase']] = (start, end)
 
-            # Step 4: Setup environment
-            self.setup_environment()
+        print(f"{Colors.CYAN}⏱  Timings ({timings['jobs']} parallel jobs):{Colors.ENDC}")
+        for step in timings['steps']:
+            if step['start'] is None:
+                print(f"   {step['name']:<24} {step['status']}")
+            else:
+                print(f"   {step['name']:<24} {step['duration']:>7.1f}s  (started at {step['start']:.1f}s, {step['status']})")
+        print()
+        for phase, (start, end) in phases.items():
+            print(f"   {phase:<24} {end - start:>7.1f}s")
+        print(f"   {'total':<24} {timings['total_seconds']:>7.1f}s  (steps alone: {timings['serial_seconds']:.1f}s)")
+        print()
 
-            # Step 5: Install dependencies
-            self.install_dependencies()
+        if self.args.timings_json:
+            timings['phases'] = {
+                phase: {'start': round(start, 3), 'duration': round(end - start, 3)}
+                for phase, (start, end) in phases.items()
+            }
+            Path(self.args.timings_json).write_text(json.dumps(timings, indent=2))
+            self.log('info', f"Timings written to {self.args.timings_json}")
 
-            # Step 6: Start Docker services
-            self.start_docker_services()
+    def run(self):
+        """Main installation flow"""
+        try:
+            self.scheduler = StepScheduler(self.build_steps(), self.args.jobs, self.output)
 
-            # Step 7: Setup database
-            self.setup_database()
+            try:
+                results = self.scheduler.run()
+            finally:
+                if self.readiness is not None:
+                    self.readiness.stop()
+                if self.scheduler.started is not None:
+                    print()
+                    self.print_timings()
 
-            # Step 8: Verify installation
-            success = self.verify_installation()
+            success = results['verify_installation']
 
-            # Step 9: Print summary
             self.print_summary()
 
             return 0 if success else 1
@@ -601,6 +1079,11 @@ def main():
     parser.add_argument('--dev', action='store_true', help='Development mode')
     parser.add_argument('--no-docker', action='store_true', help='Skip Docker installation')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Steps to run in parallel (default: {DEFAULT_JOBS}, 1 = sequential)')
+    parser.add_argument('--timings-json', metavar='FILE', help='Write per-step timings as JSON to FILE')
+    parser.add_argument('--force', action='store_true',
+                        help=f'Ignore {STATE_FILE} and re-run every step')
     args = parser.parse_args()
 
     # Setup logging